@@ -34,6 +34,7 @@ from jsonschema.validators import (
     Draft201909Validator,
     Draft202012Validator,
     RefResolver,
+    compile,
     validate,
 )
 
@@ -72,7 +72,14 @@ def dependencies_draft4_draft6_draft7(
 
 def disallow_draft3(validator, disallow, instance, schema):
     for disallowed in _utils.ensure_list(disallow):
-        if validator.is_valid(instance, {"type": [disallowed]}):
+        # Check directly rather than via a throwaway {"type": ...} schema,
+        # which would need compiling anew on every call.
+        if validator.is_type(disallowed, "object"):
+            matches = validator.is_valid(instance, disallowed)
+        else:
+            matches = validator.is_type(instance, disallowed)
+
+        if matches:
             message = f"{disallowed!r} is disallowed for {instance!r}"
             yield ValidationError(message)
 
@@ -62,6 +62,10 @@ class TypeChecker(object):
     """
     _type_checkers = attr.ib(default=pmap(), converter=pmap)
 
+    def __attrs_post_init__(self):
+        # Checkers are immutable, so look types up in a plain (faster) dict.
+        object.__setattr__(self, "_lookup", dict(self._type_checkers))
+
     def is_type(self, instance, type):
         """
         Check if the instance is of the appropriate type.
@@ -86,9 +90,8 @@ class TypeChecker(object):
             `jsonschema.exceptions.UndefinedTypeCheck`:
                 if type is unknown to this object.
         """
-        try:
-            fn = self._type_checkers[type]
-        except KeyError:
+        fn = self._lookup.get(type)
+        if fn is None:
             raise UndefinedTypeCheck(type)
 
         return fn(self, instance)
@@ -1,4 +1,6 @@
+from collections import ChainMap
 from collections.abc import Mapping, MutableMapping, Sequence
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import urlsplit
 import itertools
@@ -15,20 +17,29 @@ class URIDict(MutableMapping):
     """
 
     def normalize(self, uri):
-        return urlsplit(uri).geturl()
+        return _normalize_uri(uri)
 
     def __init__(self, *args, **kwargs):
         self.store = dict()
-        self.store.update(*args, **kwargs)
+        self.update(*args, **kwargs)
 
     def __getitem__(self, uri):
         return self.store[self.normalize(uri)]
 
+    def get(self, uri, default=None):
+        return self.store.get(self.normalize(uri), default)
+
     def __setitem__(self, uri, value):
         self.store[self.normalize(uri)] = value
 
     def __delitem__(self, uri):
-        del self.store[self.normalize(uri)]
+        uri = self.normalize(uri)
+        store = self.store
+        if isinstance(store, ChainMap) and uri not in store.maps[0]:
+            # The parent's entries can't be removed from it, so stop falling
+            # back to it, keeping a copy of its entries instead.
+            self.store = store = dict(store)
+        del store[uri]
 
     def __iter__(self):
         return iter(self.store)
@@ -39,6 +50,25 @@ class URIDict(MutableMapping):
     def __repr__(self):
         return repr(self.store)
 
+    def new_child(self):
+        """
+        Create a dictionary which falls back to looking up URIs in this one.
+
+        Changes made to the child are its own, and never affect this one.
+        Removing one of this dictionary's entries from the child makes the
+        child a copy, no longer seeing later changes to this one.
+        """
+        child = self.__class__()
+        child.store = ChainMap(child.store, self.store)
+        return child
+
+
+@lru_cache(maxsize=1024)
+def _normalize_uri(uri):
+    # The same few URIs ($schema values, meta schema and remote ref IDs)
+    # are looked up over and over, so they're normalized only once each.
+    return urlsplit(uri).geturl()
+
 
 class Unset(object):
     """
@@ -3,7 +3,6 @@ from urllib.parse import urldefrag, urljoin
 import re
 
 from jsonschema._utils import (
-    ensure_list,
     equal,
     extras_msg,
     find_additional_properties,
@@ -313,11 +312,16 @@ def dynamicRef(validator, dynamicRef, instance, schema):
 
 
 def type(validator, types, instance, schema):
-    types = ensure_list(types)
+    if isinstance(types, str):
+        # By far the most common case, so it's checked without a list
+        if validator.is_type(instance, types):
+            return
+        types = [types]
+    elif any(validator.is_type(instance, type) for type in types):
+        return
 
-    if not any(validator.is_type(instance, type) for type in types):
-        reprs = ", ".join(repr(type) for type in types)
-        yield ValidationError(f"{instance!r} is not of type {reprs}")
+    reprs = ", ".join(repr(type) for type in types)
+    yield ValidationError(f"{instance!r} is not of type {reprs}")
 
 
 def properties(validator, properties, instance, schema):
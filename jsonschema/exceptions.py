@@ -122,10 +122,15 @@ class _Error(Exception):
                 path += "." + elem
         return path
 
-    def _set(self, **kwargs):
-        for k, v in kwargs.items():
-            if getattr(self, k) is _unset:
-                setattr(self, k, v)
+    def _set(self, validator, validator_value, instance, schema):
+        if self.validator is _unset:
+            self.validator = validator
+        if self.validator_value is _unset:
+            self.validator_value = validator_value
+        if self.instance is _unset:
+            self.instance = instance
+        if self.schema is _unset:
+            self.schema = schema
 
     def _contents(self):
         attrs = (
@@ -310,6 +315,9 @@ def by_relevance(weak=WEAK_MATCHES, strong=STRONG_MATCHES):
 
 
 relevance = by_relevance()
+# The key of a top level error from a non-weak validator (there being no
+# strong validators by default), which no error can outrank
+_MOST_RELEVANT = 0, True, False
 
 
 def best_match(errors, key=relevance):
@@ -345,6 +353,13 @@ def best_match(errors, key=relevance):
     Returns:
         the best matching error, or ``None`` if the iterable was empty
 
+    With the default ``key``, errors stop being consumed from ``errors`` as
+    soon as one is found which no other could outrank (one about the whole
+    instance, from a validator which isn't weak). Any exception which
+    producing the later errors would have raised (e.g. a
+    `jsonschema.exceptions.RefResolutionError` for an unresolvable
+    :validator:`$ref` elsewhere in the schema) is then never raised.
+
     .. note::
 
         This function is a heuristic. Its return value may change for a given
@@ -354,7 +369,21 @@ def best_match(errors, key=relevance):
     best = next(errors, None)
     if best is None:
         return
-    best = max(itertools.chain([best], errors), key=key)
+
+    if key is relevance:
+        # Nothing is more relevant than an error about the whole instance
+        # from a validator which isn't weak, so once one turns up there's
+        # no need to continue producing (potentially many) more errors.
+        best_key = key(best)
+        if best_key != _MOST_RELEVANT:
+            for error in errors:
+                error_key = key(error)
+                if error_key > best_key:
+                    best, best_key = error, error_key
+                    if best_key == _MOST_RELEVANT:
+                        break
+    else:
+        best = max(itertools.chain([best], errors), key=key)
 
     while best.context:
         best = min(best.context, key=key)
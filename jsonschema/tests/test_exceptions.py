@@ -154,6 +154,15 @@ class TestBestMatch(TestCase):
         validator = Draft4Validator({})
         self.assertIsNone(exceptions.best_match(validator.iter_errors({})))
 
+    def test_stops_at_the_most_relevant_error(self):
+        def errors():
+            yield exceptions.ValidationError("Deep", path=["foo"])
+            yield exceptions.ValidationError("Top", validator="type")
+            raise AssertionError("Should not have been needed!")
+
+        best = exceptions.best_match(errors())
+        self.assertEqual(best.message, "Top")
+
 
 class TestByRelevance(TestCase):
     def test_short_paths_are_better_matches(self):
@@ -1,6 +1,47 @@
 from unittest import TestCase
 
-from jsonschema._utils import equal
+from jsonschema._utils import URIDict, equal
+
+
+class TestURIDict(TestCase):
+    def test_init_normalizes(self):
+        uris = URIDict([("http://example.com#", 1)])
+        self.assertEqual(uris["http://example.com"], 1)
+
+    def test_get(self):
+        uris = URIDict([("http://example.com", 1)])
+        self.assertEqual(
+            (uris.get("http://example.com#"), uris.get("http://other.com", 2)),
+            (1, 2),
+        )
+
+    def test_new_child(self):
+        uris = URIDict()
+        uris["http://example.com#"] = 1
+        child = uris.new_child()
+        child["http://example.com/other"] = 2
+        self.assertEqual(
+            (child["http://example.com"], len(child), len(uris)),
+            (1, 2, 1),
+        )
+
+    def test_new_child_sees_later_changes_to_its_parent(self):
+        uris = URIDict()
+        child = uris.new_child()
+        uris["http://example.com"] = 1
+        self.assertEqual(child["http://example.com#"], 1)
+
+    def test_new_child_can_remove_its_parents_entries(self):
+        uris = URIDict([("http://example.com", 1), ("http://other.com", 2)])
+        child = uris.new_child()
+        del child["http://example.com#"]
+        self.assertEqual(
+            (dict(child), dict(uris)),
+            (
+                {"http://other.com": 2},
+                {"http://example.com": 1, "http://other.com": 2},
+            ),
+        )
 
 
 class TestEqual(TestCase):
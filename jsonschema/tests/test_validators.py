@@ -1,4 +1,4 @@
-from collections import deque, namedtuple
+from collections import OrderedDict, deque, namedtuple
 from contextlib import contextmanager
 from decimal import Decimal
 from io import BytesIO
@@ -9,6 +9,7 @@ import os
 import sys
 import tempfile
 import unittest
+import warnings
 
 from twisted.trial.unittest import SynchronousTestCase
 import attr
@@ -52,6 +53,10 @@ class TestCreateAndExtend(SynchronousTestCase):
             ),
         )
 
+    def test_validators_are_read_only(self):
+        with self.assertRaises(TypeError):
+            self.Validator.VALIDATORS["endswith"] = startswith
+
     def test_init(self):
         schema = {"startswith": "foo"}
         self.assertEqual(self.Validator(schema).schema, schema)
@@ -76,6 +81,59 @@ class TestCreateAndExtend(SynchronousTestCase):
         self.assertEqual(len(errors), 1)
         self.assertEqual(errors[0]._contents(), expected_error._contents())
 
+    def test_iter_errors_compiles_each_schema_once(self):
+        seen = []
+
+        def applicable_validators(schema):
+            seen.append(schema)
+            return schema.items()
+
+        Validator = validators.create(
+            meta_schema=self.meta_schema,
+            validators=self.validators,
+            applicable_validators=applicable_validators,
+        )
+        schema = {"startswith": "hel"}
+        validator = Validator(schema)
+
+        self.assertTrue(validator.is_valid("hello"))
+        self.assertFalse(validator.is_valid("goodbye"))
+        self.assertEqual(seen, [schema])
+
+    def test_no_applicable_validators_does_not_enter_scope(self):
+        schema = {"$id": "some://scope", "title": "Nothing to validate"}
+        validator = self.Validator(schema, resolver=object())
+        self.assertEqual(list(validator.iter_errors("anything")), [])
+        self.assertTrue(validator.is_valid("anything"))
+
+    def test_validators_may_return_None(self):
+        Validator = validators.create(
+            meta_schema=self.meta_schema,
+            validators={"noop": lambda *args: None},
+        )
+        self.assertEqual(list(Validator({"noop": 12}).iter_errors(37)), [])
+
+    def test_validators_which_cannot_fail_are_skipped(self):
+        schema = {
+            "$id": "some://scope",
+            "additionalProperties": True,
+            "properties": {},
+            "required": [],
+        }
+        validator = validators.Draft202012Validator(schema, resolver=object())
+        self.assertEqual(list(validator.iter_errors({"foo": 12})), [])
+
+    def test_overridden_validators_are_not_skipped(self):
+        def required(validator, required, instance, schema):
+            yield exceptions.ValidationError("Whoops!")
+
+        Validator = validators.extend(
+            validators.Draft202012Validator,
+            validators={"required": required},
+        )
+        error, = Validator({"required": []}).iter_errors({})
+        self.assertEqual(error.message, "Whoops!")
+
     def test_if_a_version_is_provided_it_is_registered(self):
         Validator = validators.create(
             meta_schema={"$id": "something"},
@@ -84,6 +142,21 @@ class TestCreateAndExtend(SynchronousTestCase):
         self.addCleanup(validators.meta_schemas.pop, "something")
         self.assertEqual(Validator.__name__, "MyVersionValidator")
 
+    def test_registered_meta_schemas_are_in_new_resolver_stores(self):
+        meta_schema = {"$id": "something"}
+        validators.RefResolver("", {})
+        validators.create(meta_schema=meta_schema, version="my version")
+        self.addCleanup(validators.meta_schemas.pop, "something")
+        resolver = validators.RefResolver("", {})
+        self.assertEqual(resolver.store["something"], meta_schema)
+
+    def test_unregistered_meta_schemas_are_not_in_new_resolver_stores(self):
+        validators.create(meta_schema={"$id": "something"}, version="v")
+        self.addCleanup(validators.validators.pop, "v")
+        validators.meta_schemas.pop("something")
+        resolver = validators.RefResolver("", {})
+        self.assertNotIn("something", resolver.store)
+
     def test_dashes_are_stripped_from_validator_names(self):
         Validator = validators.create(
             meta_schema={"$id": "something"},
@@ -161,6 +234,55 @@ class TestCreateAndExtend(SynchronousTestCase):
             ),
         )
 
+    def test_extend_keeps_vocabulary_schemas(self):
+        Original = validators.Draft202012Validator
+        Extended = validators.extend(Original)
+        self.assertEqual(
+            Extended.VOCABULARY_SCHEMAS,
+            Original.VOCABULARY_SCHEMAS,
+        )
+
+    def test_extended_meta_schema_changes_leave_the_original_alone(self):
+        Original = validators.Draft7Validator
+        Extended = validators.extend(Original)
+        Extended.META_SCHEMA["required"] = ["foo"]
+        self.assertEqual(
+            (
+                Extended.META_SCHEMA["required"],
+                Original.META_SCHEMA.get("required"),
+            ),
+            (["foo"], None),
+        )
+
+    def test_extend_registers_its_meta_schema(self):
+        meta_schema = {"$id": "some://other/meta/schema"}
+        Original = validators.create(meta_schema=meta_schema)
+        Extended = validators.extend(Original, version="my version")
+        self.addCleanup(validators.meta_schemas.pop, meta_schema["$id"])
+        self.addCleanup(validators.validators.pop, "my version")
+        self.assertEqual(
+            (
+                Extended.__name__,
+                validators.meta_schemas[meta_schema["$id"]],
+                validators.RefResolver("", {}).store[meta_schema["$id"]],
+            ),
+            ("MyVersionValidator", Extended, Extended.META_SCHEMA),
+        )
+
+    def test_check_schema_uses_a_replaced_meta_schema(self):
+        Validator = validators.extend(validators.Draft7Validator)
+        Validator.check_schema({"type": "string"})
+        Validator.META_SCHEMA = {"properties": {"type": {"const": "integer"}}}
+        with self.assertRaises(exceptions.SchemaError):
+            Validator.check_schema({"type": "string"})
+
+    def test_check_schema_uses_a_meta_schema_changed_in_place(self):
+        Validator = validators.extend(validators.Draft7Validator)
+        Validator.check_schema({"type": "string"})
+        Validator.META_SCHEMA["required"] = ["foo"]
+        with self.assertRaises(exceptions.SchemaError):
+            Validator.check_schema({"type": "string"})
+
     def test_extend_idof(self):
         """
         Extending a validator preserves its notion of schema IDs.
@@ -217,6 +339,38 @@ class TestIterErrors(TestCase):
         errors = list(self.validator.iter_errors(instance, schema))
         self.assertEqual(len(errors), 4)
 
+    def test_overridden_iter_errors_sees_each_descent(self):
+        calls = []
+
+        class Validator(validators.Draft7Validator):
+            def iter_errors(self, instance, _schema=None):
+                calls.append((instance, _schema))
+                return super().iter_errors(instance, _schema)
+
+        error, = Validator({"items": {"type": "string"}}).iter_errors([1])
+        self.assertEqual(
+            (calls, list(error.path), list(error.schema_path)),
+            ([([1], None), (1, {"type": "string"})], [0], ["items", "type"]),
+        )
+
+    def test_overridden_iter_errors_decides_trivial_schemas(self):
+        class Validator(validators.Draft7Validator):
+            def iter_errors(self, instance, _schema=None):
+                yield exceptions.ValidationError("Whoops!")
+
+        self.assertEqual(
+            (Validator(True).is_valid(1), Validator({}).is_valid(1)),
+            (False, False),
+        )
+
+    def test_overridden_iter_errors_decides_annotation_only_schemas(self):
+        class Validator(validators.Draft7Validator):
+            def iter_errors(self, instance, _schema=None):
+                yield exceptions.ValidationError("Whoops!")
+
+        schema = {"title": "Title", "$comment": "Nothing to validate"}
+        self.assertFalse(Validator(schema).is_valid(1))
+
 
 class TestValidationErrorMessages(TestCase):
     def message_for(self, instance, schema, *args, **kwargs):
@@ -1083,6 +1237,27 @@ class TestValidationErrorDetails(TestCase):
             ),
         )
 
+    def test_nested_boolean_schema_False(self):
+        validator = validators.Draft7Validator({"items": [True, False]})
+        error, = validator.iter_errors([1, 2])
+
+        self.assertEqual(
+            (
+                error.message,
+                error.instance,
+                error.path,
+                error.schema_path,
+                error.json_path,
+            ),
+            (
+                "False schema does not allow 2",
+                2,
+                deque([1]),
+                deque(["items", 1]),
+                "$[1]",
+            ),
+        )
+
     def test_ref(self):
         ref, schema = "someRef", {"additionalProperties": {"type": "integer"}}
         validator = validators.Draft7Validator(
@@ -1204,12 +1379,41 @@ class ValidatorTestMixin(MetaSchemaTestsMixin, object):
     def test_non_existent_properties_are_ignored(self):
         self.Validator({object(): object()}).validate(instance=object())
 
+    def test_schema_changed_in_place_needs_a_new_validator(self):
+        schema = {"type": "integer"}
+        validator = self.Validator(schema)
+        validator.is_valid("foo")
+        schema["type"] = "string"
+        self.assertEqual(
+            (
+                validator.is_valid("foo"),
+                self.Validator(schema).is_valid("foo"),
+            ),
+            (False, True),
+        )
+
     def test_it_creates_a_ref_resolver_if_not_provided(self):
         self.assertIsInstance(
             self.Validator({}).resolver,
             validators.RefResolver,
         )
 
+    def test_created_ref_resolver_is_reused(self):
+        schema = {"type": "integer"}
+        validator = self.Validator(schema)
+        validator.validate(12)
+        resolver = validator.resolver
+        self.assertEqual(
+            (resolver.referrer, validator.resolver),
+            (schema, resolver),
+        )
+
+    def test_ref_resolver_can_be_replaced(self):
+        resolver = validators.RefResolver("", {})
+        validator = self.Validator({})
+        validator.resolver = resolver
+        self.assertIs(validator.resolver, resolver)
+
     def test_it_delegates_to_a_ref_resolver(self):
         ref, schema = "someCoolRef", {"type": "integer"}
         resolver = validators.RefResolver("", {}, store={ref: schema})
@@ -1591,6 +1795,7 @@ class TestValidatorFor(SynchronousTestCase):
         self.assertIs(validators.validator_for({}, default=None), None)
 
     def test_warns_if_meta_schema_specified_was_not_found(self):
+        self.addCleanup(validators._WARNED_ABOUT.discard, "unknownSchema")
         self.assertWarns(
             category=DeprecationWarning,
             message=(
@@ -1606,6 +1811,23 @@ class TestValidatorFor(SynchronousTestCase):
             default={},
         )
 
+    def test_warns_only_once_per_unknown_meta_schema(self):
+        schema = {"$schema": "anotherUnknownSchema"}
+        self.addCleanup(validators._WARNED_ABOUT.discard, schema["$schema"])
+        validators.validator_for(schema=schema, default={})
+        validators.validator_for(schema=schema, default={})
+        self.assertEqual(len(self.flushWarnings()), 1)
+
+    def test_warns_again_if_the_warning_was_an_error(self):
+        schema = {"$schema": "yetAnotherUnknownSchema"}
+        self.addCleanup(validators._WARNED_ABOUT.discard, schema["$schema"])
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            with self.assertRaises(DeprecationWarning):
+                validators.validator_for(schema=schema, default={})
+            with self.assertRaises(DeprecationWarning):
+                validators.validator_for(schema=schema, default={})
+
     def test_does_not_warn_if_meta_schema_is_unspecified(self):
         validators.validator_for(schema={}, default={})
         self.assertFalse(self.flushWarnings())
@@ -1703,6 +1925,95 @@ class TestValidate(SynchronousTestCase):
             validators.validate(12, schema)
         self.assertIn("12 is not of type", str(e.exception))
 
+    def test_it_raises_the_first_error_without_best_effort(self):
+        schema = {"oneOf": [{"type": "string"}, {"type": "array"}]}
+        with self.assertRaises(exceptions.ValidationError) as e:
+            validators.validate(12, schema, best_effort=False)
+        self.assertEqual(e.exception.validator, "oneOf")
+
+    def test_it_stops_at_an_error_about_the_whole_instance(self):
+        schema = {"required": ["a"], "properties": {"b": {"$ref": "#/nope"}}}
+        with self.assertRaises(exceptions.ValidationError) as e:
+            validators.validate({"b": 1}, schema)
+        self.assertEqual(e.exception.validator, "required")
+
+    def test_schema_is_checked_once(self):
+        result = []
+        self.patch(validators.Draft7Validator, "check_schema", result.append)
+        schema = {"$schema": "http://json-schema.org/draft-07/schema#"}
+        validators.validate({}, schema)
+        validators.validate([], schema)
+        self.assertEqual(result, [schema])
+
+    def test_least_recently_used_checked_schema_is_forgotten(self):
+        result = []
+        self.patch(validators.Draft7Validator, "check_schema", result.append)
+        self.patch(validators, "_CHECKED_SCHEMAS", OrderedDict())
+        self.patch(validators, "_CHECKED_SCHEMAS_SIZE", 2)
+        one, two, three = {"minimum": 1}, {"maximum": 2}, {"minLength": 3}
+        for schema in one, two, one, three, one, two:
+            validators.validate(None, schema, cls=validators.Draft7Validator)
+        self.assertEqual(result, [one, two, three, two])
+
+    def test_oldest_compiled_schema_is_forgotten(self):
+        self.patch(validators, "_COMPILED_CACHE_SIZE", 2)
+        one, two, three = {"minimum": 1}, {"maximum": 2}, {"minLength": 3}
+        validator = validators.Draft7Validator({})
+        for schema in one, two, three:
+            validator.is_valid(None, schema)
+        self.assertEqual(list(validator._compiled), [id(two), id(three)])
+
+    def test_schema_changed_in_place_is_checked_again(self):
+        schema = {"type": "integer"}
+        validators.validate(12, schema)
+        schema["type"] = 12
+        with self.assertRaises(exceptions.SchemaError):
+            validators.validate(12, schema)
+
+    def test_schema_changed_to_an_equal_bool_is_checked_again(self):
+        schema = {"minimum": 1}
+        validators.validate(5, schema)
+        schema["minimum"] = True
+        with self.assertRaises(exceptions.SchemaError):
+            validators.validate(5, schema)
+
+    def test_schema_changed_to_an_equal_float_is_checked_again(self):
+        schema = {"maxLength": 1}
+        validators.validate("a", schema, cls=validators.Draft4Validator)
+        schema["maxLength"] = 1.0
+        with self.assertRaises(exceptions.SchemaError):
+            validators.validate("a", schema, cls=validators.Draft4Validator)
+
+    def test_schema_changed_in_place_is_used(self):
+        schema = {"items": {"type": "integer"}}
+        validators.validate([12], schema)
+        schema["items"]["type"] = "string"
+        with self.assertRaises(exceptions.ValidationError):
+            validators.validate([12], schema)
+
+    def test_schema_changed_to_an_equal_bool_is_used(self):
+        schema = {"const": 1}
+        validators.validate(1, schema)
+        schema["const"] = True
+        with self.assertRaises(exceptions.ValidationError):
+            validators.validate(1, schema)
+
+    def test_compile(self):
+        schema = {"$schema": "http://json-schema.org/draft-07/schema#"}
+        validator = validators.compile(schema)
+        self.assertEqual(
+            (type(validator), validator.schema),
+            (validators.Draft7Validator, schema),
+        )
+
+    def test_compile_with_cls(self):
+        validator = validators.compile({}, cls=validators.Draft4Validator)
+        self.assertIsInstance(validator, validators.Draft4Validator)
+
+    def test_compile_checks_the_schema(self):
+        with self.assertRaises(exceptions.SchemaError):
+            validators.compile({"type": 12})
+
 
 class TestRefResolver(SynchronousTestCase):
 
@@ -1745,6 +2056,29 @@ class TestRefResolver(SynchronousTestCase):
         with resolver.resolving("http://bar/schema#/a") as resolved:
             self.assertEqual(resolved, schema["a"])
 
+    def test_it_resolves_local_anchors(self):
+        schema = {
+            "$defs": {
+                "a": {"$anchor": "foo", "type": "integer"},
+                "b": {"$anchor": "bar", "c": {"$dynamicAnchor": "baz"}},
+            },
+        }
+        resolver = validators.RefResolver.from_schema(schema)
+        with resolver.resolving("#foo") as resolved:
+            self.assertIs(resolved, schema["$defs"]["a"])
+        with resolver.resolving("#bar") as resolved:
+            self.assertIs(resolved, schema["$defs"]["b"])
+        with resolver.resolving("#baz") as resolved:
+            self.assertIs(resolved, schema["$defs"]["b"]["c"])
+
+    def test_it_can_remove_known_meta_schemas_from_its_store(self):
+        uri = "http://json-schema.org/draft-07/schema"
+        self.assertEqual(
+            (self.resolver.store.pop(uri), uri in self.resolver.store),
+            (validators.Draft7Validator.META_SCHEMA, False),
+        )
+        self.assertIn(uri, validators.RefResolver("", {}).store)
+
     def test_it_retrieves_stored_refs(self):
         with self.resolver.resolving(self.stored_uri) as resolved:
             self.assertIs(resolved, self.stored_schema)
@@ -1882,6 +2216,21 @@ class TestRefResolver(SynchronousTestCase):
                 self.fail("Shouldn't get this far!")  # pragma: no cover
         self.assertEqual(err.exception, exceptions.RefResolutionError(error))
 
+    def test_in_scope(self):
+        resolver = validators.RefResolver("http://example.com/", {})
+        with resolver.in_scope("foo/"):
+            self.assertEqual(
+                resolver.resolution_scope, "http://example.com/foo/",
+            )
+        self.assertEqual(resolver.resolution_scope, "http://example.com/")
+
+    def test_in_scope_exits_on_error(self):
+        resolver = validators.RefResolver("http://example.com/", {})
+        with self.assertRaises(ZeroDivisionError):
+            with resolver.in_scope("foo/"):
+                1 / 0
+        self.assertEqual(resolver.resolution_scope, "http://example.com/")
+
     def test_helpful_error_message_on_failed_pop_scope(self):
         resolver = validators.RefResolver("", {})
         resolver.pop_scope()
@@ -1,12 +1,14 @@
 """
 Creation and extension of validators, with implementations for existing drafts.
 """
-from collections.abc import Sequence
+from collections import OrderedDict, deque
+from collections.abc import Mapping, Sequence
 from functools import lru_cache
+from types import MappingProxyType
 from urllib.parse import unquote, urldefrag, urljoin, urlsplit
 from urllib.request import urlopen
 from warnings import warn
-import contextlib
+import itertools
 import json
 import warnings
 
@@ -18,11 +20,95 @@ from jsonschema import (
     exceptions,
 )
 
+_unset = _utils.Unset()
+
+# None of the caches below is guarded by a lock. Each is only ever read or
+# changed with single dict or set operations, which are atomic (with or
+# without a GIL), and no result depends on a cache hit -- so threads racing
+# to fill one at worst repeat some work (checking a schema or warning twice)
+# or drop entries, never see a partially built one.
+
 validators = {}
 meta_schemas = _utils.URIDict()
 _VOCABULARIES = _utils.URIDict()
 
 
+class _KnownSchemas(Mapping):
+    """
+    The registered meta schemas and vocabularies, by (normalized) URI.
+
+    This is a read-only view rather than a copy, so it always reflects
+    what is currently registered (including after a meta schema has been
+    removed from `meta_schemas`).
+    """
+
+    def __getitem__(self, uri):
+        vocabulary = _VOCABULARIES.store.get(uri)
+        if vocabulary is not None:
+            return vocabulary
+        return meta_schemas.store[uri].META_SCHEMA
+
+    def __iter__(self):
+        return iter(self._snapshot())
+
+    def __len__(self):
+        return len(self._snapshot())
+
+    def values(self):
+        return self._snapshot().values()
+
+    def _snapshot(self):
+        # Copy each in one go, as a validator class registered meanwhile in
+        # another thread would otherwise break iterating over them.
+        classes, vocabularies = dict(meta_schemas.store), _VOCABULARIES.store
+        schemas = {uri: cls.META_SCHEMA for uri, cls in classes.items()}
+        schemas.update(vocabularies.copy())
+        return schemas
+
+
+# Known meta schemas and vocabularies, which every RefResolver's store shares
+_DEFAULT_STORE = _utils.URIDict()
+_DEFAULT_STORE.store = _KnownSchemas()
+# Indexes (of IDs and anchors) for the documents in the default store
+_DEFAULT_INDEXES = {}
+
+# The most (sub)schemas a single validator will hold compiled at once (after
+# which the one compiled longest ago is dropped for each newly compiled one)
+_COMPILED_CACHE_SIZE = 4096
+
+# Unknown $schema URIs which validator_for has already warned about
+_WARNED_ABOUT = set()
+
+# Schemas which validate has most recently checked (least recently used
+# first), by validator class and identity
+_CHECKED_SCHEMAS = OrderedDict()
+_CHECKED_SCHEMAS_SIZE = 128
+
+# Built in validator callables, each along with the one value for which it
+# can never produce an error (and so needn't be called at all)
+_NO_OP_VALUES = {
+    _validators.additionalItems: True,
+    _validators.additionalProperties: True,
+    _validators.allOf: [],
+    _validators.dependentRequired: {},
+    _validators.dependentSchemas: {},
+    _validators.patternProperties: {},
+    _validators.properties: {},
+    _validators.propertyNames: True,
+    _validators.required: [],
+}
+
+
+def _is_no_op(validator, value):
+    """
+    Check whether calling the given validator callable is pointless.
+    """
+    if validator not in _NO_OP_VALUES:
+        return False
+    no_op = _NO_OP_VALUES[validator]
+    return type(value) is type(no_op) and value == no_op
+
+
 def __getattr__(name):
     if name == "ErrorTree":
         warnings.warn(
@@ -74,12 +160,21 @@ def _id_of(schema):
     return schema.get("$id", "")
 
 
-def _store_schema_list():
-    return [
-        (id, validator.META_SCHEMA) for id, validator in meta_schemas.items()
-    ] + [
-        (id, schema) for id, schema in _VOCABULARIES.items()
-    ]
+# Joining URIs is pure, so resolvers share a single cache of joined scopes
+_urljoin_cache = lru_cache(4096)(urljoin)
+
+
+@lru_cache(maxsize=4096)
+def _pointer_parts(fragment):
+    """
+    Split a (leading slash stripped) JSON pointer into its unescaped parts.
+    """
+    if not fragment:
+        return ()
+    return tuple(
+        part.replace("~1", "/").replace("~0", "~")
+        for part in unquote(fragment).split("/")
+    )
 
 
 def create(
@@ -113,6 +208,9 @@ def create(
                 3. the instance
                 4. the schema
 
+            and return an iterable of errors (most simply by being a
+            generator), or ``None`` if there are none.
+
         version (str):
 
             an identifier for the version that this validator class will
@@ -145,75 +243,141 @@ def create(
 
     class Validator:
 
-        VALIDATORS = dict(validators)
+        __slots__ = (
+            "format_checker",
+            "schema",
+            "_compiled",
+            "_resolver",
+            "__weakref__",
+        )
+
+        VALIDATORS = MappingProxyType(dict(validators))
         META_SCHEMA = dict(meta_schema)
         VOCABULARY_SCHEMAS = list(vocabulary_schemas)
         TYPE_CHECKER = type_checker
         ID_OF = staticmethod(id_of)
 
         def __init__(self, schema, resolver=None, format_checker=None):
-            if resolver is None:
-                resolver = RefResolver.from_schema(schema, id_of=id_of)
-
-            self.resolver = resolver
+            self._resolver = resolver
             self.format_checker = format_checker
             self.schema = schema
+            self._compiled = OrderedDict()
+
+        @property
+        def resolver(self):
+            # Many schemas never reference anything (nor change scope), so
+            # a resolver is only created for them if it's actually used.
+            resolver = self._resolver
+            if resolver is None:
+                resolver = RefResolver.from_schema(self.schema, id_of=id_of)
+                self._resolver = resolver
+            return resolver
+
+        @resolver.setter
+        def resolver(self, resolver):
+            self._resolver = resolver
 
         @classmethod
         def check_schema(cls, schema):
-            for error in cls(cls.META_SCHEMA).iter_errors(schema):
+            validator = cls(cls.META_SCHEMA)
+            for error in validator.iter_errors(schema):
                 raise exceptions.SchemaError.create_from(error)
 
+        def _compile_schema(self, schema):
+            """
+            Resolve the scope and validator callables of a (sub)schema.
+
+            The result is cached (by identity) on this validator, so that
+            repeatedly validating against the same schema does not need
+            to look up its ID or each of its keywords again.
+            """
+            compiled = []
+            for k, v in applicable_validators(schema):
+                validator = self.VALIDATORS.get(k)
+                if validator is not None and not _is_no_op(validator, v):
+                    in_schema_path = k not in {"if", "$ref"}
+                    compiled.append((k, v, validator, in_schema_path))
+
+            if len(self._compiled) >= _COMPILED_CACHE_SIZE:
+                self._compiled.popitem(last=False)
+            # Hold on to the schema itself so its id can't be reused by
+            # another schema while the entry exists.
+            entry = schema, id_of(schema), tuple(compiled)
+            self._compiled[id(schema)] = entry
+            return entry
+
         def iter_errors(self, instance, _schema=None):
+            return self._iter_errors(instance, _schema, None, None)
+
+        def descend(self, instance, schema, path=None, schema_path=None):
+            if type(self).iter_errors is not Validator.iter_errors:
+                # A subclass overrides iter_errors, so it must see each
+                # descent (which the fused generator would skip over).
+                errors = self.iter_errors(instance, schema)
+                return _prefixed(errors, path, schema_path)
+            return self._iter_errors(instance, schema, path, schema_path)
+
+        def _iter_errors(self, instance, _schema, path, schema_path):
+            """
+            Lazily yield each of the errors in the given instance.
+
+            Errors are prefixed with ``path`` and ``schema_path`` (unless
+            they are ``None``) as they are produced, which lets `descend`
+            share this generator rather than wrapping it in another one.
+            """
             if _schema is None:
                 _schema = self.schema
 
             if _schema is True:
                 return
             elif _schema is False:
-                yield exceptions.ValidationError(
+                error = exceptions.ValidationError(
                     f"False schema does not allow {instance!r}",
                     validator=None,
                     validator_value=None,
                     instance=instance,
                     schema=_schema,
                 )
+                if path is not None:
+                    error.path.appendleft(path)
+                if schema_path is not None:
+                    error.schema_path.appendleft(schema_path)
+                yield error
+                return
+
+            compiled = self._compiled.get(id(_schema))
+            if compiled is None:
+                compiled = self._compile_schema(_schema)
+            _, scope, validators = compiled
+            if not validators:
+                # Nothing to validate, so there's no need to enter its scope
                 return
 
-            scope = id_of(_schema)
             if scope:
                 self.resolver.push_scope(scope)
             try:
-                validators = applicable_validators(_schema)
-                for k, v in validators:
-                    validator = self.VALIDATORS.get(k)
-                    if validator is None:
+                for k, v, validator, in_schema_path in validators:
+                    errors = validator(self, v, instance, _schema)
+                    if errors is None:
                         continue
-
-                    errors = validator(self, v, instance, _schema) or ()
                     for error in errors:
                         # set details if not already set by the called fn
-                        error._set(
-                            validator=k,
-                            validator_value=v,
-                            instance=instance,
-                            schema=_schema,
-                        )
-                        if k not in {"if", "$ref"}:
-                            error.schema_path.appendleft(k)
+                        error._set(k, v, instance, _schema)
+                        if path is not None:
+                            error.path.appendleft(path)
+                        if schema_path is None:
+                            if in_schema_path:
+                                error.schema_path.appendleft(k)
+                        elif in_schema_path:
+                            # prefix both levels of the path at once
+                            error.schema_path.extendleft((k, schema_path))
+                        else:
+                            error.schema_path.appendleft(schema_path)
                         yield error
             finally:
                 if scope:
                     self.resolver.pop_scope()
 
-        def descend(self, instance, schema, path=None, schema_path=None):
-            for error in self.iter_errors(instance, schema):
-                if path is not None:
-                    error.path.appendleft(path)
-                if schema_path is not None:
-                    error.schema_path.appendleft(schema_path)
-                yield error
-
         def validate(self, *args, **kwargs):
             for error in self.iter_errors(*args, **kwargs):
                 raise error
@@ -225,15 +389,49 @@ def create(
                 raise exceptions.UnknownType(type, instance, self.schema)
 
         def is_valid(self, instance, _schema=None):
+            if _schema is None:
+                _schema = self.schema
+            # (A subclass overriding iter_errors must always be asked.)
+            if type(self).iter_errors is Validator.iter_errors:
+                if _schema is True:
+                    return True
+                elif _schema is not False:
+                    compiled = self._compiled.get(id(_schema))
+                    if compiled is None:
+                        compiled = self._compile_schema(_schema)
+                    if not compiled[2]:
+                        # Only annotations (or nothing at all), so valid
+                        return True
+
             error = next(self.iter_errors(instance, _schema), None)
             return error is None
 
     if version is not None:
-        Validator = validates(version)(Validator)
-        Validator.__name__ = (
-            version.title().replace(" ", "").replace("-", "") + "Validator"
-        )
+        Validator = _versioned(Validator, version)
+
+    return Validator
+
+
+def _prefixed(errors, path, schema_path):
+    """
+    Prefix each of the given errors' paths as they are produced.
+    """
+    for error in errors:
+        if path is not None:
+            error.path.appendleft(path)
+        if schema_path is not None:
+            error.schema_path.appendleft(schema_path)
+        yield error
 
+
+def _versioned(Validator, version):
+    """
+    Name and register a validator class for the given version.
+    """
+    Validator = validates(version)(Validator)
+    Validator.__name__ = (
+        version.title().replace(" ", "").replace("-", "") + "Validator"
+    )
     return Validator
 
 
@@ -281,13 +479,15 @@ def extend(validator, validators=(), version=None, type_checker=None):
 
     .. note:: Meta Schemas
 
-        The new validator class will have its parent's meta schema.
+        The new validator class will have its parent's meta schema (and
+        vocabulary schemas).
 
         If you wish to change or extend the meta schema in the new
         validator class, modify ``META_SCHEMA`` directly on the returned
-        class. Note that no implicit copying is done, so a copy should
-        likely be made before modifying it, in order to not affect the
-        old validator.
+        class. It is a shallow copy of the parent's, so its top level
+        keys may be added, replaced or removed without affecting the old
+        validator, but any nested values should be copied before being
+        modified.
     """
 
     all_validators = dict(validator.VALIDATORS)
@@ -295,13 +495,16 @@ def extend(validator, validators=(), version=None, type_checker=None):
 
     if type_checker is None:
         type_checker = validator.TYPE_CHECKER
-    return create(
+    extended = create(
         meta_schema=validator.META_SCHEMA,
+        vocabulary_schemas=validator.VOCABULARY_SCHEMAS,
         validators=all_validators,
-        version=version,
         type_checker=type_checker,
         id_of=validator.ID_OF,
     )
+    if version is not None:
+        extended = _versioned(extended, version)
+    return extended
 
 
 Draft3Validator = create(
@@ -576,7 +779,8 @@ class RefResolver(object):
         urljoin_cache (:func:`functools.lru_cache`):
 
             A cache that will be used for caching the results of joining
-            the resolution scope to subscopes.
+            the resolution scope to subscopes. If unprovided, one shared
+            by all resolvers is used.
 
         remote_cache (:func:`functools.lru_cache`):
 
@@ -601,7 +805,7 @@ class RefResolver(object):
         remote_cache=None,
     ):
         if urljoin_cache is None:
-            urljoin_cache = lru_cache(1024)(urljoin)
+            urljoin_cache = _urljoin_cache
         if remote_cache is None:
             remote_cache = lru_cache(1024)(self.resolve_from_url)
 
@@ -610,12 +814,13 @@ class RefResolver(object):
         self.handlers = dict(handlers)
 
         self._scopes_stack = [base_uri]
-        self.store = _utils.URIDict(_store_schema_list())
+        self.store = _DEFAULT_STORE.new_child()
         self.store.update(store)
         self.store[base_uri] = referrer
 
         self._urljoin_cache = urljoin_cache
         self._remote_cache = remote_cache
+        self._indexes = {}
 
     @classmethod
     def from_schema(cls, schema, id_of=_id_of, *args, **kwargs):
@@ -687,18 +892,12 @@ class RefResolver(object):
         uri, _ = urldefrag(self.resolution_scope)
         return uri
 
-    @contextlib.contextmanager
     def in_scope(self, scope):
         """
         Temporarily enter the given scope for the duration of the context.
         """
-        self.push_scope(scope)
-        try:
-            yield
-        finally:
-            self.pop_scope()
+        return _InScope(self, scope)
 
-    @contextlib.contextmanager
     def resolving(self, ref):
         """
         Resolve the given ``ref`` and enter its resolution scope.
@@ -711,25 +910,44 @@ class RefResolver(object):
 
                 The reference to resolve
         """
+        return _Resolving(self, ref)
 
-        url, resolved = self.resolve(ref)
-        self.push_scope(url)
-        try:
-            yield resolved
-        finally:
-            self.pop_scope()
-
-    def _finditem(self, schema, key):
-        results = []
-        if isinstance(schema, dict):
-            if key in schema:
-                results.append(schema)
-
-            for v in schema.values():
-                if isinstance(v, dict):
-                    results += self._finditem(v, key)
+    def _index_document(self, document):
+        """
+        Find the subschemas of a document which have an ID or an anchor.
 
-        return results
+        The document is walked only once, with the result cached for
+        subsequent lookups within it (by any resolver, for the documents in
+        the default store).
+        """
+        index = self._indexes.get(id(document))
+        if index is None:
+            index = _DEFAULT_INDEXES.get(id(document))
+        if index is not None:
+            return index[1:]
+
+        ids, anchors = [], {}
+        stack = deque([document])
+        while stack:
+            subschema = stack.pop()
+            if not isinstance(subschema, dict):
+                continue
+
+            if "$id" in subschema:
+                ids.append(subschema)
+            for keyword in "$anchor", "$dynamicAnchor":
+                anchor = subschema.get(keyword)
+                if isinstance(anchor, str):
+                    anchors.setdefault((keyword, anchor), subschema)
+
+            # Walk depth first, in document order, so the first match wins.
+            stack.extend(reversed(list(subschema.values())))
+
+        indexes = self._indexes
+        if any(document is each for each in _DEFAULT_STORE.store.values()):
+            indexes = _DEFAULT_INDEXES
+        indexes[id(document)] = document, ids, anchors
+        return ids, anchors
 
     def resolve_local(self, url, schema):
         """
@@ -737,7 +955,8 @@ class RefResolver(object):
         """
         uri, fragment = urldefrag(url)
 
-        for subschema in self._finditem(schema, "$id"):
+        ids, _ = self._index_document(schema)
+        for subschema in ids:
             target_uri = self._urljoin_cache(
                 self.resolution_scope, subschema["$id"],
             )
@@ -790,16 +1009,14 @@ class RefResolver(object):
         fragment = fragment.lstrip("/")
 
         if fragment:
-            for keyword in ["$anchor", "$dynamicAnchor"]:
-                for subschema in self._finditem(document, keyword):
-                    if fragment == subschema[keyword]:
-                        return subschema
+            _, anchors = self._index_document(document)
+            for keyword in "$anchor", "$dynamicAnchor":
+                subschema = anchors.get((keyword, fragment))
+                if subschema is not None:
+                    return subschema
 
         # Resolve via path
-        parts = unquote(fragment).split("/") if fragment else []
-        for part in parts:
-            part = part.replace("~1", "/").replace("~0", "~")
-
+        for part in _pointer_parts(fragment):
             if isinstance(document, Sequence):
                 # Array indexes should be turned into integers
                 try:
@@ -867,7 +1084,48 @@ class RefResolver(object):
         return result
 
 
-def validate(instance, schema, cls=None, *args, **kwargs):
+class _InScope(object):
+    """
+    Enter a scope of a `RefResolver` for the duration of a context.
+
+    Written out by hand rather than with `contextlib.contextmanager`, which
+    is comparatively slow for something entered on every ``$ref``.
+    """
+
+    __slots__ = ("_resolver", "_scope")
+
+    def __init__(self, resolver, scope):
+        self._resolver = resolver
+        self._scope = scope
+
+    def __enter__(self):
+        self._resolver.push_scope(self._scope)
+
+    def __exit__(self, *exc_info):
+        self._resolver.pop_scope()
+
+
+class _Resolving(object):
+    """
+    Resolve a reference and enter its scope for the duration of a context.
+    """
+
+    __slots__ = ("_resolver", "_ref")
+
+    def __init__(self, resolver, ref):
+        self._resolver = resolver
+        self._ref = ref
+
+    def __enter__(self):
+        url, resolved = self._resolver.resolve(self._ref)
+        self._resolver.push_scope(url)
+        return resolved
+
+    def __exit__(self, *exc_info):
+        self._resolver.pop_scope()
+
+
+def validate(instance, schema, cls=None, *args, best_effort=True, **kwargs):
     """
     Validate an instance under the given schema.
 
@@ -880,10 +1138,17 @@ def validate(instance, schema, cls=None, *args, **kwargs):
     itself valid, since not doing so can lead to less obvious error
     messages and fail in less obvious or consistent ways.
 
-    If you know you have a valid schema already, especially if you
-    intend to validate multiple instances with the same schema, you
-    likely would prefer using the `IValidator.validate` method directly
-    on a specific validator (e.g. ``Draft7Validator.validate``).
+    The result of this check is remembered for the 128 most recently used
+    schemas, so validating many instances under one schema with
+    :func:`validate` doesn't check it again each time. Telling whether a
+    schema was changed in place since it was checked still means comparing
+    all of it to a copy (its `repr`) taken back then, which is done on
+    every call, and takes time (and memory) proportional to the schema's
+    size. If you intend to validate multiple instances with the same
+    schema, you therefore likely would prefer to create a validator once
+    with `compile` (or, if you know you have a valid schema already,
+    directly from a specific validator class, e.g.
+    ``Draft7Validator(schema)``) and use its `IValidator.validate` method.
 
 
     Arguments:
@@ -900,6 +1165,15 @@ def validate(instance, schema, cls=None, *args, **kwargs):
 
             The class that will be used to validate the instance.
 
+        best_effort (bool):
+
+            Whether to look through all of the instance's errors for the
+            one which best describes what is wrong with it (using
+            `jsonschema.exceptions.best_match`), or to instead raise the
+            first error found. Passing ``False`` is faster for invalid
+            instances, and is useful when any error will do, e.g. when
+            all that matters is whether an instance is valid.
+
     If the ``cls`` argument is not provided, two things will happen
     in accordance with the specification. First, if the schema has a
     :validator:`$schema` property containing a known meta-schema [#]_
@@ -926,13 +1200,101 @@ def validate(instance, schema, cls=None, *args, **kwargs):
     if cls is None:
         cls = validator_for(schema)
 
-    cls.check_schema(schema)
+    compiled = _check_schema_once(cls, schema)
     validator = cls(schema, *args, **kwargs)
-    error = exceptions.best_match(validator.iter_errors(instance))
+    if hasattr(validator, "_compiled"):
+        # Reuse what previous calls compiled rather than starting over.
+        # (The validator itself isn't reused, as its resolver has state.)
+        validator._compiled = compiled
+    errors = validator.iter_errors(instance)
+    error = next(errors, None)
     if error is not None:
+        if best_effort:
+            error = exceptions.best_match(itertools.chain([error], errors))
         raise error
 
 
+def compile(schema, cls=None, *args, **kwargs):
+    """
+    Create a validator for the given schema, having first checked the schema.
+
+        >>> validator = compile({"maxItems": 2})
+        >>> validator.is_valid([2, 3])
+        True
+        >>> validator.validate([2, 3, 4])
+        Traceback (most recent call last):
+            ...
+        ValidationError: [2, 3, 4] is too long
+
+    The returned validator can be used to validate any number of
+    instances, without repeating the work of picking a validator class
+    or checking the schema, which :func:`validate` does on each call.
+
+    Arguments:
+
+        schema:
+
+            The schema to validate with
+
+        cls (IValidator):
+
+            The class of validator to create. If unprovided, it is chosen
+            from the schema's :validator:`$schema` property as in
+            :func:`validate`.
+
+    Any other provided positional and keyword arguments will be passed
+    on when instantiating the ``cls``.
+
+    Returns:
+
+        `jsonschema.IValidator`
+
+    Raises:
+
+        `jsonschema.exceptions.SchemaError` if the schema itself
+            is invalid
+    """
+    if cls is None:
+        cls = validator_for(schema)
+
+    cls.check_schema(schema)
+    return cls(schema, *args, **kwargs)
+
+
+def _check_schema_once(cls, schema):
+    """
+    Check a schema as in ``cls.check_schema``, unless already done.
+
+    Schemas are remembered by identity, along with their `repr`, so that
+    one changed in place since it was checked is checked again. Unlike
+    ``==`` (or even `_utils.equal`), comparing reprs tells apart values
+    like ``1``, ``1.0`` and ``True``, which meta schemas (and validation)
+    may not treat alike.
+
+    Returns:
+
+        a cache of compiled (sub)schemas, which validators of the class
+        for this schema may share
+    """
+    key, snapshot = (cls, id(schema)), repr(schema)
+    checked = _CHECKED_SCHEMAS.get(key)
+    # The entry holds onto the schema, so its id can't have been reused
+    if checked is not None and checked[1] == snapshot:
+        try:
+            _CHECKED_SCHEMAS.move_to_end(key)
+        except KeyError:
+            # Another thread just evicted it; it'll be checked again next time
+            pass
+        return checked[2]
+
+    cls.check_schema(schema)
+    if len(_CHECKED_SCHEMAS) >= _CHECKED_SCHEMAS_SIZE:
+        _CHECKED_SCHEMAS.popitem(last=False)
+    compiled = OrderedDict()
+    _CHECKED_SCHEMAS[key] = schema, snapshot, compiled
+    return compiled
+
+
 def validator_for(schema, default=_LATEST_VERSION):
     """
     Retrieve the validator class appropriate for validating the given schema.
@@ -954,16 +1316,26 @@ def validator_for(schema, default=_LATEST_VERSION):
             If unprovided, the default is to return the latest supported
             draft.
     """
-    if schema is True or schema is False or "$schema" not in schema:
+    if type(schema) is bool:
         return default
-    if schema["$schema"] not in meta_schemas:
-        warn(
-            (
-                "The metaschema specified by $schema was not found. "
-                "Using the latest draft to validate, but this will raise "
-                "an error in the future."
-            ),
-            DeprecationWarning,
-            stacklevel=2,
-        )
-    return meta_schemas.get(schema["$schema"], _LATEST_VERSION)
+
+    uri = schema.get("$schema", _unset)
+    if uri is _unset:
+        return default
+
+    cls = meta_schemas.get(uri)
+    if cls is None:
+        if uri not in _WARNED_ABOUT:
+            warn(
+                (
+                    "The metaschema specified by $schema was not found. "
+                    "Using the latest draft to validate, but this will raise "
+                    "an error in the future."
+                ),
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            # Only once it's been warned about without being made an error
+            _WARNED_ABOUT.add(uri)
+        return _LATEST_VERSION
+    return cls